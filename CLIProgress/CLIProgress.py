@@ -11,44 +11,50 @@
 # --maxmaxassignlength=10000 to avoid truncating all but the longest variables.
 #
 import enum
-import functools
 import re
 import shutil
+import signal
 import sys
+import threading
 import time
 
+# On Windows, coloring output needs colorama to fix up the console. Look for it
+# once on import rather than on every construction.
+colorama = None
+if sys.platform == "win32":
+    try:
+        import colorama
+    except ImportError:
+        pass
 
-@functools.total_ordering
-class Verbosity(enum.Enum):
+
+class Verbosity(enum.IntEnum):
     QUIET = 0
     NORMAL = 1
     DEBUG = 2
 
-    def __eq__(self, value):
-        if isinstance(value, Verbosity):
-            return self.value == value.value
-        return NotImplemented
-
-    def __lt__(self, other):
-        if isinstance(other, Verbosity):
-            return self.value < other.value
-        return NotImplemented
-
     @classmethod
     def from_string(cls, s):
-        s = s.upper()
-        if s in cls.__members__:
-            return cls[s]
-        return cls.NORMAL
+        return cls.__members__.get(s.upper(), cls.NORMAL)
+
+
+# Matches ANSI SGR escape sequences (colors and styles).
+_ANSI_ESC_RE = re.compile(r"\033\[[0-9;]*m")
+
+
+# Resets all colors and styles.
+_ANSI_RESET = "\033[0m"
 
 
 # ANSI escape codes for colors and styles.
 class _ANSICode:
+    __slots__ = ("code",)
+
     def __init__(self, code: str):
         self.code = code
 
     def __call__(self, text: str) -> str:
-        return f"{self.code}{text}{ANSI.RESET}"
+        return self.code + text + _ANSI_RESET
 
     def __repr__(self) -> str:
         return self.code
@@ -58,28 +64,18 @@ class _ANSICode:
 
 
 class ANSI:
-    RESET = _ANSICode("\033[0m")
+    RESET = _ANSICode(_ANSI_RESET)
 
     class Cursor:
         CLEAR_LINE = "\033[2K"
 
         HOME = "\r"
 
-        @staticmethod
-        def UP(n: int = 1) -> str:
-            return f"\033[{n}A"
-
-        @staticmethod
-        def DOWN(n: int = 1) -> str:
-            return f"\033[{n}B"
-
-        @staticmethod
-        def LEFT(n: int = 1) -> str:
-            return f"\033[{n}D"
-
-        @staticmethod
-        def RIGHT(n: int = 1) -> str:
-            return f"\033[{n}C"
+        # Cursor movements by n cells, indexed by n.
+        UP = tuple(f"\033[{n}A" for n in range(16))
+        DOWN = tuple(f"\033[{n}B" for n in range(16))
+        LEFT = tuple(f"\033[{n}D" for n in range(16))
+        RIGHT = tuple(f"\033[{n}C" for n in range(16))
 
     class Fore:
         BLACK = _ANSICode("\033[30m")
@@ -129,19 +125,29 @@ class ANSI:
     @staticmethod
     def len(text: str) -> int:
         """Return the length of the text, ignoring ANSI escape codes."""
-        return len(re.sub(r"\033\[[0-9;]*m", "", text))
+        if "\033" not in text:
+            return len(text)
+        return len(_ANSI_ESC_RE.sub("", text))
 
 
 class TraceStack:
+    __slots__ = ("_trace_parts", "_depth", "_stack", "has_warnings", "has_errors")
+
+    # Indentation is capped at 20 levels to keep deeply nested traces readable.
+    _INDENTS = tuple("  " * i for i in range(21))
+
     def __init__(self):
-        self._trace: str = ""
+        # Trace lines, or a formatter and the raw parts of a keyword header or
+        # log message to only format if the trace is actually read (most traces
+        # are silently discarded).
+        self._trace_parts: list[str | tuple] = []
         self._depth: int = 0
-        self._stack: list[str] = []
+        self._stack: list[tuple] = []
         self.has_warnings: bool = False
         self.has_errors: bool = False
 
     def clear(self):
-        self._trace = ""
+        self._trace_parts.clear()
         self._depth = 0
         self._stack.clear()
         self.has_warnings = False
@@ -149,33 +155,113 @@ class TraceStack:
 
     @property
     def _indent(self) -> str:
-        return "  " * min(self._depth, 20)
+        depth = self._depth
+        return TraceStack._INDENTS[depth if depth < 20 else 20]
+
+    @property
+    def has_trace(self) -> bool:
+        return bool(self._trace_parts)
 
     @property
     def trace(self) -> str:
-        return self._trace
+        return self.format_trace()
+
+    def format_trace(self, *header: str) -> str:
+        """Format the trace, preceded by any header lines, in a single join."""
+        if not self._trace_parts:
+            return ""
+        parts = list(header)
+        parts.extend(
+            part if isinstance(part, str) else part[0](*part[1:])
+            for part in self._trace_parts
+        )
+        # Join with a trailing empty part to end with a newline, rather than
+        # copying the whole trace again to append one.
+        parts.append("")
+        return "\n".join(parts)
+
+    @staticmethod
+    def _format_keyword(indent: str, kwstr: str, args) -> str:
+        argstr = ", ".join(repr(a) for a in args) if args else ""
+        return f"{indent}▶ {kwstr}({argstr})"
+
+    @staticmethod
+    def _format_keyword_status(indent: str, status: str, elapsed_ms) -> str:
+        elapsed = (
+            TestTimings.format_time(elapsed_ms / 1000.0)
+            if elapsed_ms is not None
+            else "?s"
+        )
+        return f"{indent}  {status}    {elapsed}"
 
-    def push_keyword(self, keyword_line: str):
-        self._stack.append(self._indent + keyword_line)
+    @staticmethod
+    def _format_log(
+        indent: str, level_initial: str, text: str, color: _ANSICode | None
+    ) -> str:
+        # Fast path for the common case of a single line message.
+        if "\n" not in text:
+            line = f"{level_initial} {text}"
+            return indent + (color(line) if color else line)
+
+        text_lines = text.splitlines()
+        lines = []
+        # First line gets level initial
+        lines.append(f"{level_initial} {text_lines[0]}")
+        # Remaining lines align without repeating the level
+        for text_line in text_lines[1:]:
+            lines.append(f"  {text_line}")
+
+        if color:
+            # Color each line separately, wrapping them all in one join.
+            prefix = color.code
+            body = (_ANSI_RESET + "\n" + prefix).join(lines)
+            return indent + prefix + body + _ANSI_RESET
+
+        return indent + "\n".join(lines)
+
+    def push_keyword(self, kwstr: str, args=None):
+        """Push a keyword header, formatting its arguments only when read."""
+        self._stack.append((TraceStack._format_keyword, self._indent, kwstr, args))
         self._depth += 1
 
     def pop_keyword(self):
         self._stack.pop()
         self._depth -= 1
 
-    def append_trace(self, trace_line: str):
-        self._trace += self._indent + trace_line + "\n"
+    def append_keyword_status(self, status: str, elapsed_ms):
+        """Append a keyword's status to the trace, formatting it only when read."""
+        self._trace_parts.append(
+            (TraceStack._format_keyword_status, self._indent, status, elapsed_ms)
+        )
+
+    def append_log(self, level_initial: str, text: str, color: _ANSICode | None):
+        """Append a log message to the trace, formatting it only when read."""
+        self._trace_parts.append(
+            (TraceStack._format_log, self._indent, level_initial, text, color)
+        )
 
     def flush(self, decrement_depth: bool = True):
         """Flush any pending keyword headers to the trace and clear the stack."""
         if decrement_depth:
             self._depth -= 1
-        for trace_line in self._stack:
-            self._trace += trace_line + "\n"
+        self._trace_parts.extend(self._stack)
         self._stack.clear()
 
 
 class TestStatistics:
+    __slots__ = (
+        "top_level_suite_count",
+        "top_level_test_count",
+        "started_suites",
+        "started_tests",
+        "passed_tests",
+        "skipped_tests",
+        "failed_tests",
+        "completed_tests",
+        "warnings",
+        "errors",
+    )
+
     def __init__(self):
         self.top_level_suite_count: int | None = None
         self.top_level_test_count: int | None = None
@@ -234,20 +320,27 @@ class TestStatistics:
 
 
 class TestTimings:
+    __slots__ = ("run_start_time", "current_test_start_time")
+
+    # Most durations are under a minute, so pre-format those.
+    _SECONDS = tuple(f"{s:2d}s" for s in range(60))
+
     def __init__(self):
         self.run_start_time: float | None = None
         self.current_test_start_time: float | None = None
 
     def _record_run_start(self):
         if self.run_start_time is None:
-            self.run_start_time = time.time()
+            self.run_start_time = time.monotonic()
 
     def start_suite(self):
         self._record_run_start()
 
     def start_test(self):
-        self._record_run_start()
-        self.current_test_start_time = time.time()
+        now = time.monotonic()
+        if self.run_start_time is None:
+            self.run_start_time = now
+        self.current_test_start_time = now
 
     def end_test(self):
         self.current_test_start_time = None
@@ -256,7 +349,10 @@ class TestTimings:
     def format_time(seconds: float | int | None) -> str:
         if seconds is None:
             return "unknown"
-        seconds = int(round(seconds))
+        # Round half up, rather than round()'s half to even.
+        seconds = int(seconds + 0.5)
+        if 0 <= seconds < 60:
+            return TestTimings._SECONDS[seconds]
         m, s = divmod(seconds, 60)
         h, m = divmod(m, 60)
         if h:
@@ -266,17 +362,19 @@ class TestTimings:
         else:
             return f"{s:2d}s"
 
-    def get_elapsed_time(self) -> float:
+    def get_elapsed_time(self, now: float | None = None) -> float:
         if self.run_start_time is None:
             return 0.0
-        return time.time() - self.run_start_time
+        if now is None:
+            now = time.monotonic()
+        return now - self.run_start_time
 
-    def format_elapsed_time(self) -> str:
-        return self.format_time(self.get_elapsed_time())
+    def format_elapsed_time(self, now: float | None = None) -> str:
+        return self.format_time(self.get_elapsed_time(now))
 
-    def format_eta(self, stats: TestStatistics) -> str:
+    def format_eta(self, stats: TestStatistics, now: float | None = None) -> str:
         if stats.completed_tests and stats.top_level_test_count:
-            elapsed_time = self.get_elapsed_time()
+            elapsed_time = self.get_elapsed_time(now)
             avg_test_time = elapsed_time / stats.completed_tests
             remaining_tests = stats.top_level_test_count - stats.completed_tests
             eta_time = avg_test_time * remaining_tests
@@ -284,9 +382,101 @@ class TestTimings:
         return "unknown"
 
 
+# Past tense forms of Robot's result statuses, which are all upper case.
+_PAST_TENSE = {
+    "PASS": "PASSED",
+    "FAIL": "FAILED",
+    "SKIP": "SKIPPED",
+    "NOT RUN": "NOT RUN",
+}
+
+
+# Colors used for log messages of each level.
+_LEVEL_COLOR = {
+    "ERROR": ANSI.Fore.BRIGHT_RED,
+    "FAIL": ANSI.Fore.BRIGHT_RED,
+    "WARN": ANSI.Fore.BRIGHT_YELLOW,
+    "SKIP": ANSI.Fore.YELLOW,
+    "INFO": ANSI.Fore.BRIGHT_BLACK,
+    "DEBUG": ANSI.Fore.WHITE,
+    "TRACE": ANSI.Fore.WHITE,
+}
+
+
+# Keyword status markers shown in traces, with and without colors.
+_KEYWORD_STATUS = {
+    "PASS": "✓ PASS",
+    "SKIP": "→ SKIP",
+    "FAIL": "✗ FAIL",
+}
+_KEYWORD_STATUS_COLORED = {
+    "PASS": ANSI.Fore.BRIGHT_GREEN(_KEYWORD_STATUS["PASS"]),
+    "SKIP": ANSI.Fore.YELLOW(_KEYWORD_STATUS["SKIP"]),
+    "FAIL": ANSI.Fore.BRIGHT_RED(_KEYWORD_STATUS["FAIL"]),
+}
+
+
 class CLIProgress:
     ROBOT_LISTENER_API_VERSION = 3
 
+    # The listener is called for every keyword and log message, so avoid the
+    # per-instance dict for its (frequently read) attributes.
+    __slots__ = (
+        "verbosity",
+        "colors",
+        "progress_stream",
+        "_level_colors",
+        "_keyword_status",
+        "print_passed",
+        "print_skipped",
+        "print_warned",
+        "print_errored",
+        "print_failed",
+        "terminal_width",
+        "_max_width",
+        "_resized",
+        "_prev_sigwinch",
+        "progress_lines",
+        "_line_texts",
+        "_buf",
+        "_painted_lines",
+        "_pending_keyword",
+        "_last_repaint",
+        "_min_frame_interval",
+        "_repaint_lock",
+        "_repaint_event",
+        "_repaint_thread",
+        "_timings_text",
+        "_timings_time",
+        "_text_width",
+        "_top_border",
+        "_bot_border",
+        "_line_fmt",
+        "_blank_line",
+        "stats",
+        "timings",
+        "test_trace_stack",
+        "suite_trace_stack",
+        "_active_stack",
+    )
+
+    # Move cursor to the line inside the box, write the text, then move the
+    # cursor back down to the bottom of the box.
+    # For line 0, we want to move up 3 lines (to the first empty line in the box).
+    # For line 1, we want to move up 2 lines.
+    # For line 2, we want to move up 1 line.
+    _LINE_PREFIX = tuple(
+        ANSI.Cursor.UP[3 - i] + ANSI.Cursor.HOME + "│ " for i in range(3)
+    )
+    _LINE_SUFFIX = tuple(" │" + ANSI.Cursor.DOWN[3 - i] for i in range(3))
+
+    # Clear the current line and move the cursor up 4 times, then clear the
+    # final line and reset the cursor to the start of the line. This clears
+    # the entire box (3 lines of text + top and bottom borders).
+    _CLEAR_SEQ = (ANSI.Cursor.CLEAR_LINE + ANSI.Cursor.UP[1]) * 4 + (
+        ANSI.Cursor.CLEAR_LINE + ANSI.Cursor.HOME
+    )
+
     def __init__(
         self,
         verbosity: str = "NORMAL",
@@ -295,7 +485,6 @@ class CLIProgress:
         width: int = 120,
     ):
         # Parse verbosity argument.
-        verbosity = verbosity.upper()
         self.verbosity = Verbosity.from_string(verbosity)
         # Parse colors argument.
         colors = colors.upper()
@@ -305,12 +494,7 @@ class CLIProgress:
             self.colors = False
         else:  # Assume AUTO.
             if sys.stdout.isatty():
-                if sys.platform == "win32":
-                    import importlib.util
-
-                    self.colors = importlib.util.find_spec("colorama") is not None
-                else:
-                    self.colors = True
+                self.colors = sys.platform != "win32" or colorama is not None
             else:
                 self.colors = False
         # Parse console_progress argument.
@@ -329,6 +513,12 @@ class CLIProgress:
         else:  # Assume NONE.
             self.progress_stream = None
 
+        # Without colors, no log levels are colored.
+        self._level_colors = _LEVEL_COLOR if self.colors else {}
+        self._keyword_status = (
+            _KEYWORD_STATUS_COLORED if self.colors else _KEYWORD_STATUS
+        )
+
         # Configure output based on verbosity.
         self.print_passed = self.verbosity >= Verbosity.DEBUG
         self.print_skipped = self.verbosity >= Verbosity.DEBUG
@@ -337,21 +527,59 @@ class CLIProgress:
         self.print_failed = self.verbosity >= Verbosity.QUIET
 
         # Set properties.
-        self.terminal_width = min(
-            shutil.get_terminal_size(fallback=(width, 40)).columns, width
-        )
-        self.progress_lines = ["", "", ""]
+        self._max_width = width
+        self._set_terminal_width()
+        self.progress_lines = [self._blank_line] * 3
+        # The left and right text of each progress line, to lay them out again
+        # when the terminal is resized.
+        self._line_texts = [("", "")] * 3
+        self._buf: list[str] = []
+        # Progress lines as last drawn. Lines that differ need repainting, but
+        # repaints happen at most once per frame interval unless forced, so a
+        # line that changes and changes back in between is never redrawn.
+        self._painted_lines = [self._blank_line] * 3
+        # The name and arguments of the latest keyword, only formatted into the
+        # keyword progress line if it is still current when a frame is drawn.
+        self._pending_keyword: tuple | None = None
+        self._last_repaint = 0.0
+        self._min_frame_interval = 1 / 30
+        # Held back repaints are drawn by a background thread, started when
+        # first needed, so everything it reads or draws is guarded by a lock.
+        self._repaint_lock = threading.RLock()
+        self._repaint_event = threading.Event()
+        self._repaint_thread: threading.Thread | None = None
+        self._timings_text = ""
+        self._timings_time: float | None = None
+
         self.stats = TestStatistics()
         self.timings = TestTimings()
         self.test_trace_stack = TraceStack()
         self.suite_trace_stack = TraceStack()
+        # The stack keywords and log messages are currently traced into.
+        self._active_stack = self.suite_trace_stack
 
-        # On Windows, import colorama if we're coloring output.
-        if self.colors and sys.platform == "win32":
-            import colorama
-
+        # On Windows, let colorama fix the console if we're coloring output.
+        if self.colors and colorama is not None:
             colorama.just_fix_windows_console()
 
+        # Redraw the progress box to fit the terminal when it is resized. The
+        # signal handler only notes the resize; the next repaint handles it.
+        self._resized = False
+        self._prev_sigwinch = None
+        if self.progress_stream and hasattr(signal, "SIGWINCH"):
+            try:
+                prev = signal.signal(signal.SIGWINCH, self._on_resize)
+            except ValueError:
+                # Signal handlers can only be set from the main thread.
+                pass
+            else:
+                # Resizes shouldn't interrupt blocking calls in the tests'
+                # libraries, which may not retry on EINTR.
+                signal.siginterrupt(signal.SIGWINCH, False)
+                # Handlers not set from Python can't be restored, so restore
+                # the default instead.
+                self._prev_sigwinch = signal.SIG_DFL if prev is None else prev
+
         # Finally, prepare the console interface.
         self._draw_progress_box()
 
@@ -361,11 +589,39 @@ class CLIProgress:
     def in_test(self) -> bool:
         return self.timings.current_test_start_time is not None
 
+    def _set_terminal_width(self):
+        columns = shutil.get_terminal_size(fallback=(self._max_width, 40)).columns
+        # Keep room for at least a few characters inside the box, however
+        # narrow the terminal.
+        self.terminal_width = max(min(columns, self._max_width), 8)
+        # Pre-render the parts of the progress box that only depend on width.
+        self._text_width = self.terminal_width - 4
+        self._top_border = "┌" + "─" * (self.terminal_width - 2) + "┐\n"
+        self._bot_border = "└" + "─" * (self.terminal_width - 2) + "┘"
+        tw = self._text_width
+        self._line_fmt = f"│ %-{tw}.{tw}s │\n"
+        self._blank_line = " " * tw
+
+    def _on_resize(self, signum, frame):
+        self._resized = True
+        if callable(self._prev_sigwinch):
+            self._prev_sigwinch(signum, frame)
+
+    def _apply_resize(self):
+        self._resized = False
+        self._clear_progress_box()
+        self._set_terminal_width()
+        for i, (left_text, right_text) in enumerate(self._line_texts):
+            self._write_progress_line(i, left_text, right_text)
+        self._draw_progress_box()
+
     def _writeln(self, text=""):
         sys.stdout.write(text + "\n")
-        sys.stdout.flush()
 
     def _past_tense(self, verb: str) -> str:
+        past = _PAST_TENSE.get(verb)
+        if past is not None:
+            return past
         is_upper = verb.isupper()
         is_title = verb.istitle()
         v = verb.lower()
@@ -383,67 +639,186 @@ class CLIProgress:
             return res.title()
         return res
 
+    def _format_args_preview(self, args) -> str:
+        # Only format as many arguments as are visible in the progress line;
+        # anything beyond the box width would be truncated anyway.
+        width = self._text_width
+        parts = []
+        length = -2
+        for arg in args:
+            parts.append(repr(arg))
+            length += len(parts[-1]) + 2
+            if length >= width:
+                break
+        return ", ".join(parts)[:width]
+
+    def _emit(self):
+        """Write all buffered progress output in a single call, then flush."""
+        self.progress_stream.write("".join(self._buf))
+        self._buf.clear()
+        self.progress_stream.flush()
+
+    def _write_pending_keyword(self):
+        name, args = self._pending_keyword
+        self._pending_keyword = None
+        argstr = self._format_args_preview(args) if args else ""
+        self._write_progress_line(2, f"[{name}]  {argstr}")
+
     def _draw_progress_box(self):
         if not self.progress_stream:
             return
-        text_width = self.terminal_width - 4
-        self.progress_stream.write("┌" + "─" * (self.terminal_width - 2) + "┐\n")
+        if self._pending_keyword is not None:
+            self._write_pending_keyword()
+        self._buf.append(self._top_border)
         for i in range(3):
-            self.progress_stream.write(
-                f"│ {self.progress_lines[i]:<{text_width}.{text_width}} │\n"
-            )
-        self.progress_stream.write("└" + "─" * (self.terminal_width - 2) + "┘")
-        self.progress_stream.flush()
+            self._buf.append(self._line_fmt % self.progress_lines[i])
+        self._painted_lines[:] = self.progress_lines
+        self._buf.append(self._bot_border)
+        self._emit()
 
     def _clear_progress_box(self):
         if not self.progress_stream:
             return
-        # Clear the current line and move the cursor up. Do this 5 times to
-        # clear the entire box (3 lines of text + top and bottom borders).
-        for _ in range(4):
-            self.progress_stream.write(ANSI.Cursor.CLEAR_LINE + ANSI.Cursor.UP())
-        # Clear the final line and reset the cursor to the start of the line.
-        self.progress_stream.write(ANSI.Cursor.CLEAR_LINE + ANSI.Cursor.HOME)
-        self.progress_stream.flush()
+        self._buf.append(CLIProgress._CLEAR_SEQ)
+        self._emit()
 
     def _write_progress_line(
         self, line_no: int, left_text: str = "", right_text: str = ""
     ):
         if not self.progress_stream:
             return
-        # Format the left and right text into a single line. Right text takes
-        # priority. Truncate left text with '...' if necessary.
-        text_width = self.terminal_width - 4
-        right_len = len(right_text)
-        max_left = text_width - right_len - 1 if right_len > 0 else text_width
-        max_left = max(0, max_left)
-        if len(left_text) > max_left:
-            if max_left >= 3:
-                left_text = left_text[: max_left - 3] + "..."
-            else:
-                left_text = left_text[:max_left]
-        padding = max(0, text_width - len(left_text) - right_len)
-        text = f"{left_text}{' ' * padding}{right_text}"
-
-        # Move cursor to the line inside the box and write the text.
-        # For line 0, we want to move up 3 lines (to the first empty line in the box).
-        # For line 1, we want to move up 2 lines.
-        # For line 2, we want to move up 1 line.
         assert line_no >= 0 and line_no < 3, "line_no must be between 0 and 2"
-        self.progress_lines[line_no] = text
-        line_offset = 3 - line_no
-        self.progress_stream.write(ANSI.Cursor.UP(line_offset))
-        self.progress_stream.write(ANSI.Cursor.HOME + f"│ {text} │")
-        # Move cursor back down to the bottom of the box.
-        self.progress_stream.write(ANSI.Cursor.DOWN(line_offset))
-        self.progress_stream.flush()
+        with self._repaint_lock:
+            self._line_texts[line_no] = (left_text, right_text)
+            if not left_text and not right_text:
+                # Clearing lines is common enough to reuse a pre-rendered blank.
+                self.progress_lines[line_no] = self._blank_line
+                return
+            # Format the left and right text into a single line. Right text takes
+            # priority. Truncate left text with '...' if necessary.
+            text_width = self._text_width
+            right_len = len(right_text)
+            max_left = text_width - right_len - 1 if right_len > 0 else text_width
+            max_left = max(0, max_left)
+            left_len = len(left_text)
+            if left_len > max_left:
+                if max_left >= 3:
+                    left_text = left_text[: max_left - 3] + "..."
+                else:
+                    left_text = left_text[:max_left]
+                left_len = max_left
+            # Multiplying by a negative padding (right text wider than the box)
+            # gives an empty string.
+            padding = text_width - left_len - right_len
+            # Lines are only repainted if this differs from what was last drawn.
+            self.progress_lines[line_no] = left_text + " " * padding + right_text
+
+    def _redraw_progress_line(self, line_no: int):
+        self._buf.append(
+            CLIProgress._LINE_PREFIX[line_no]
+            + self.progress_lines[line_no]
+            + CLIProgress._LINE_SUFFIX[line_no]
+        )
+
+    def _format_timings(self) -> str:
+        """Return the elapsed time and ETA, recalculated at most once a second."""
+        now = time.monotonic()
+        if self._timings_time is None or now - self._timings_time >= 1.0:
+            self._timings_time = now
+            self._timings_text = (
+                f"(elapsed {self.timings.format_elapsed_time(now)}, "
+                f"ETA {self.timings.format_eta(self.stats, now)})"
+            )
+        return self._timings_text
+
+    def _maybe_repaint(self, force: bool = False):
+        """Draw the progress lines changed since the last repaint.
+
+        Keyword events can arrive far faster than anyone can read them, so
+        unless forced this draws at most once per frame interval. Anything
+        held back is drawn by a trailing repaint at the end of the interval, so
+        the box is never more than a frame out of date. All the changed lines
+        are written and flushed together.
+        """
+        with self._repaint_lock:
+            if self._resized:
+                self._apply_resize()
+            if (
+                self._pending_keyword is None
+                and self.progress_lines == self._painted_lines
+            ):
+                return
+            now = time.monotonic()
+            elapsed = now - self._last_repaint
+            if not force and elapsed < self._min_frame_interval:
+                if self._repaint_thread is None:
+                    self._repaint_thread = threading.Thread(
+                        target=self._run_repaint_thread,
+                        name="CLIProgress repaint",
+                        daemon=True,
+                    )
+                    self._repaint_thread.start()
+                self._repaint_event.set()
+                return
+            self._last_repaint = now
+            if self._pending_keyword is not None:
+                self._write_pending_keyword()
+            for i in range(3):
+                if self.progress_lines[i] != self._painted_lines[i]:
+                    self._redraw_progress_line(i)
+                    self._painted_lines[i] = self.progress_lines[i]
+            if self._buf:
+                self._emit()
+
+    def _run_repaint_thread(self):
+        """Draw held back repaints once their frame interval has passed."""
+        while True:
+            self._repaint_event.wait()
+            with self._repaint_lock:
+                # Cleared by close().
+                if self._repaint_thread is not threading.current_thread():
+                    return
+                self._repaint_event.clear()
+                delay = self._last_repaint + self._min_frame_interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._trailing_repaint()
+
+    def _trailing_repaint(self):
+        with self._repaint_lock:
+            # Cleared by close().
+            if self._repaint_thread is None:
+                return
+            try:
+                self._maybe_repaint(force=True)
+            except (OSError, ValueError):
+                # Robot can't report errors from the repaint thread, so stop
+                # drawing the progress box if its stream can't be written to
+                # (e.g. a broken pipe) rather than failing every frame.
+                self._buf.clear()
+                self.progress_stream = None
 
     def _print_trace(self, text: str):
+        with self._repaint_lock:
+            self._print_trace_locked(text)
+
+    def _print_trace_locked(self, text: str):
+        # When the progress box shares stdout with the trace, clear the box,
+        # print the trace and redraw the box in a single write.
+        if self.progress_stream is sys.stdout:
+            self._buf.append(CLIProgress._CLEAR_SEQ)
+            self._buf += (text, "\n")
+            self._draw_progress_box()
+            return
+        # Otherwise each stream must be flushed before switching to the other
+        # to keep them in order (and a trace without a progress box should
+        # still appear promptly).
         # First clear the progress box, so we don't have to worry about
         # interleaving with the trace output.
         self._clear_progress_box()
         # Then print the trace text as normal.
         self._writeln(text)
+        sys.stdout.flush()
         # Finally redraw the progress box with the current test progress.
         self._draw_progress_box()
 
@@ -457,15 +832,13 @@ class CLIProgress:
         self._write_progress_line(
             0, f"[SUITE {self.stats.format_suite_progress()}] {suite.full_name}"
         )
+        self._maybe_repaint()
 
     def end_suite(self, suite, result):
-        trace = self.suite_trace_stack.trace
-        self.suite_trace_stack.clear()
-
         self._write_progress_line(0)
 
         status_text = ""
-        if trace:
+        if self.suite_trace_stack.has_trace:
             if result.status == "PASS" and self.print_passed:
                 status_text = "SUITE PASSED"
                 if self.colors:
@@ -480,10 +853,14 @@ class CLIProgress:
                     status_text = ANSI.Fore.RED(status_text)
         if status_text:
             status_line = f"{status_text}: {suite.full_name}"
-            underline = "═" * ANSI.len(status_line)
-            if not trace:
-                trace = result.message + "\n"
-            self._print_trace(f"{status_line}\n{underline}\n{trace}")
+            # Without colors there are no escape codes to ignore.
+            status_len = ANSI.len(status_line) if self.colors else len(status_line)
+            underline = "═" * status_len
+            self._print_trace(
+                self.suite_trace_stack.format_trace(status_line, underline)
+            )
+        self.suite_trace_stack.clear()
+        self._maybe_repaint(force=True)
 
     # ------------------------------------------------------------------ test
 
@@ -491,18 +868,20 @@ class CLIProgress:
         self.stats.start_test()
         self.timings.start_test()
         self.test_trace_stack.clear()
+        self._active_stack = self.test_trace_stack
 
-        self._write_progress_line(
-            1,
-            f"[TEST {self.stats.format_test_progress()}] {test.name}",
-            f"(elapsed {self.timings.format_elapsed_time()}, "
-            f"ETA {self.timings.format_eta(self.stats)})",
-        )
+        if self.progress_stream:
+            self._write_progress_line(
+                1,
+                f"[TEST {self.stats.format_test_progress()}] {test.name}",
+                self._format_timings(),
+            )
+            self._maybe_repaint()
 
     def end_test(self, test, result):
-        trace = self.test_trace_stack.trace
         self.stats.end_test(result)
         self.timings.end_test()
+        self._active_stack = self.suite_trace_stack
         self._write_progress_line(1)
         if not result.not_run:
             should_print = False
@@ -529,107 +908,79 @@ class CLIProgress:
                 if self.colors and status_color:
                     status_text = status_color(status_text)
                 status_line = f"{status_text}: {test.full_name}"
-                underline = "═" * ANSI.len(status_line)
-                if not trace:
-                    trace = result.message + "\n"
-                trace = f"{status_line}\n{underline}\n{trace}"
+                # Without colors there are no escape codes to ignore.
+                status_len = ANSI.len(status_line) if self.colors else len(status_line)
+                underline = "═" * status_len
+                if self.test_trace_stack.has_trace:
+                    trace = self.test_trace_stack.format_trace(status_line, underline)
+                else:
+                    trace = f"{status_line}\n{underline}\n{result.message}\n"
                 self._print_trace(trace)
         self.test_trace_stack.clear()
+        self._maybe_repaint(force=True)
 
     # ------------------------------------------------------------------ keyword
 
     def start_keyword(self, keyword, result):
-        stack = self.test_trace_stack if self.in_test else self.suite_trace_stack
-        name = (
-            getattr(result, "kwname", None)
-            or getattr(result, "name", None)
-            or "<unknown>"
-        )
-        lib = getattr(result, "libname", None)
-        args = getattr(result, "args", None) or []
-        argstr = ", ".join(repr(a) for a in args)
+        stack = self._active_stack
+        try:
+            name = result.kwname or result.name or "<unknown>"
+            lib = result.libname
+            args = result.args
+        except AttributeError:
+            # Not every body item (e.g. control structures) has the full set of
+            # keyword attributes, so fall back to the slower lookups.
+            name = (
+                getattr(result, "kwname", None)
+                or getattr(result, "name", None)
+                or "<unknown>"
+            )
+            lib = getattr(result, "libname", None)
+            args = getattr(result, "args", None)
         kwstr = f"{lib}.{name}" if lib else name
-        trace_line = f"▶ {kwstr}({argstr})"
-        stack.push_keyword(trace_line)
+        # The arguments are only formatted in full if this trace is printed.
+        stack.push_keyword(kwstr, args)
 
-        self._write_progress_line(2, f"[{name}]  {argstr}")
+        if self.progress_stream:
+            with self._repaint_lock:
+                self._pending_keyword = (name, args)
+            self._maybe_repaint()
 
     def end_keyword(self, keyword, result):
-        stack = self.test_trace_stack if self.in_test else self.suite_trace_stack
+        stack = self._active_stack
         if result.status == "NOT RUN":
             # Discard; the header was never flushed so it just disappears.
             stack.pop_keyword()
-            self._write_progress_line(2)
+            self._clear_keyword_line()
             return
 
         # Keyword ran - flush any pending ancestor headers (and this one)
         # so the hierarchy appears in the trace.
         stack.flush()
 
-        elapsed_ms = getattr(result, "elapsedtime", None)
-
-        elapsed = (
-            TestTimings.format_time(elapsed_ms / 1000.0)
-            if elapsed_ms is not None
-            else "?s"
-        )
-
-        keyword_trace = "  "
-        if result.status == "PASS":
-            status = "✓ PASS"
-            if self.colors:
-                status = ANSI.Fore.BRIGHT_GREEN(status)
-            keyword_trace += f"{status}    {elapsed}"
-        elif result.status == "SKIP":
-            status = "→ SKIP"
-            if self.colors:
-                status = ANSI.Fore.YELLOW(status)
-            keyword_trace += f"{status}    {elapsed}"
-        elif result.status == "FAIL":
-            status = "✗ FAIL"
-            if self.colors:
-                status = ANSI.Fore.BRIGHT_RED(status)
-            keyword_trace += f"{status}    {elapsed}"
-        else:
-            keyword_trace += f"? {result.status}    {elapsed}"
+        status = self._keyword_status.get(result.status)
+        if status is None:
+            status = f"? {result.status}"
+        stack.append_keyword_status(status, getattr(result, "elapsedtime", None))
 
-        stack.append_trace(keyword_trace)
+        self._clear_keyword_line()
 
-        self._write_progress_line(2)
+    def _clear_keyword_line(self):
+        with self._repaint_lock:
+            self._pending_keyword = None
+            self._write_progress_line(2)
+        self._maybe_repaint()
 
     # ------------------------------------------------------------------ logging
 
     def log_message(self, message):
-        level = getattr(message, "level", None) or "UNKNOWN"
-        text = getattr(message, "message", None) or ""
+        level = message.level or "UNKNOWN"
+        text = message.message or ""
 
         # Flush keyword headers so they appear above the log line.
-        stack = self.test_trace_stack if self.in_test else self.suite_trace_stack
+        stack = self._active_stack
         stack.flush(decrement_depth=False)
 
-        level_initial = level[0].upper()
-        text_lines = text.splitlines()
-        lines = []
-        # First line gets level initial
-        lines.append(f"{level_initial} {text_lines[0]}")
-        # Remaining lines align without repeating the level
-        for text_line in text_lines[1:]:
-            lines.append(f"  {text_line}")
-
-        if self.colors:
-            if level == "ERROR":
-                lines = [ANSI.Fore.BRIGHT_RED(line) for line in lines]
-            elif level == "FAIL":
-                lines = [ANSI.Fore.BRIGHT_RED(line) for line in lines]
-            elif level == "WARN":
-                lines = [ANSI.Fore.BRIGHT_YELLOW(line) for line in lines]
-            elif level == "SKIP":
-                lines = [ANSI.Fore.YELLOW(line) for line in lines]
-            elif level == "INFO":
-                lines = [ANSI.Fore.BRIGHT_BLACK(line) for line in lines]
-            elif level == "DEBUG" or level == "TRACE":
-                lines = [ANSI.Fore.WHITE(line) for line in lines]
-
         if level == "ERROR":
             self.stats.errors += 1
             stack.has_errors = True
@@ -637,13 +988,21 @@ class CLIProgress:
             self.stats.warnings += 1
             stack.has_warnings = True
 
-        stack.append_trace("\n".join(lines))
+        stack.append_log(level[0].upper(), text, self._level_colors.get(level))
 
     # ------------------------------------------------------------------ close
 
     def close(self):
-        self._clear_progress_box()
-
+        with self._repaint_lock:
+            # The box is cleared, so there is nothing left to repaint.
+            self._repaint_thread = None
+            self._repaint_event.set()
+            self._clear_progress_box()
+        if self._prev_sigwinch is not None:
+            signal.signal(signal.SIGWINCH, self._prev_sigwinch)
+            self._prev_sigwinch = None
+
+        # The summary is flushed once, after all of it has been written.
         if self.verbosity >= Verbosity.QUIET:
             self._writeln("RUN COMPLETE: " + self.stats.format_run_results())
 
@@ -653,3 +1012,4 @@ class CLIProgress:
         ):
             elapsed_str = self.timings.format_elapsed_time()
             self._writeln(f"Total elapsed: {elapsed_str}.")
+        sys.stdout.flush()
@@ -6,6 +6,29 @@
 import subprocess
 import sys
 
+# Options which take a value and are interpreted by the runner, mapped to the
+# listener argument they set and whether they are also passed through to Robot.
+_VALUE_OPTIONS = {
+    "-C": ("colors", True),
+    "--consolecolors": ("colors", True),
+    "-W": ("width", True),
+    "--consolewidth": ("width", True),
+    "--consoleprogress": ("console_progress", False),
+}
+
+# The runner's own flags, mapped to the listener verbosity they set.
+_VERBOSITY_FLAGS = {
+    "--verbose": "DEBUG",
+    "--quiet": "QUIET",
+}
+
+# The start of the robot command, up to the listener. Robot's own console
+# output is quietened so it doesn't interleave with the listener's.
+_ROBOT_PREFIX = ("robot", "--console=quiet", "--listener")
+
+# Listener arguments, in the order they are passed to the listener.
+_LISTENER_ARGS = ("colors", "width", "console_progress", "verbosity")
+
 
 def main():
     args = sys.argv[1:]
@@ -13,8 +36,9 @@ def main():
     # Normalize arguments to match Robot's argument handling, as documented by:
     # https://robotframework.org/robotframework/latest/RobotFrameworkUserGuide.html#using-command-line-options
     # Specifically, we implement the following rules:
-    # - Long options are case-insensitive and hyphen-insensitive.
-    # - Option calues are separated by a space (`--include tag`, `-i tag`),
+    # - Long options are case-insensitive and hyphen-insensitive. Short options
+    #   are case-sensitive (e.g., -c is not -C).
+    # - Option values are separated by a space (`--include tag`, `-i tag`),
     #   equals (`--include=tag`), or no separator for short (`-itag`).
     # - Repeated single-value options: last value wins.
     # - Repeated multi-value options: values are appended.
@@ -36,76 +60,59 @@ def main():
     # - --verbose
     # - --quiet
     robot_args = []
-    console_colors = None
-    console_width = None
-    console_progress = None
-    verbosity = None
+    listener_args = {}
 
     arg_iter = iter(args)
     for arg in arg_iter:
+        # Pass straight through anything that isn't an option (e.g. the paths
+        # to test), which is most arguments.
+        if not arg.startswith("-"):
+            robot_args.append(arg)
+            continue
+
         # Normalize argument to determine its name and potential inline value.
         if arg.startswith("--"):
-            parts = arg.split("=", 1)
-            name = "--" + parts[0][2:].lower().replace("-", "")
-            value = parts[1] if len(parts) > 1 else None
-        elif arg.startswith("-") and len(arg) > 2 and arg[1] != "-":
+            name, sep, value = arg.partition("=")
+            name = "--" + name[2:].lower().replace("-", "")
+            if not sep:
+                value = None
+        elif len(arg) > 2:
             name = arg[:2]
             value = arg[2:]
         else:
             name = arg
             value = None
 
-        # Extract value from the next argument if needed and not inline.
-        needs_value = name in {
-            "-C",
-            "--consolecolors",
-            "-W",
-            "--consolewidth",
-            "--consoleprogress",
-        }
-        consumed_next = False
-        if needs_value and value is None:
-            try:
-                value = next(arg_iter)
-                consumed_next = True
-            except StopIteration:
-                pass
+        # Capture our custom flags, which aren't passed through to Robot.
+        verbosity = _VERBOSITY_FLAGS.get(name)
+        if verbosity is not None:
+            listener_args["verbosity"] = verbosity
+            continue
 
-        # Capture specific arguments.
-        if name in {"-C", "--consolecolors"}:
-            console_colors = value
-        elif name in {"-W", "--consolewidth"}:
-            console_width = value
-        elif name == "--consoleprogress":
-            console_progress = value
-        elif name == "--verbose":
-            verbosity = "DEBUG"
-        elif name == "--quiet":
-            verbosity = "QUIET"
+        # Pass through anything else that we don't interpret.
+        option = _VALUE_OPTIONS.get(name)
+        if option is None:
+            robot_args.append(arg)
+            continue
 
-        # Reconstruct robot_args, omitting our custom arguments.
-        if name not in {"--consoleprogress", "--verbose", "--quiet"}:
+        # Extract value from the next argument if not inline.
+        key, pass_through = option
+        consumed_next = False
+        if value is None:
+            value = next(arg_iter, None)
+            consumed_next = value is not None
+        if value is not None:
+            listener_args[key] = value
+        if pass_through:
             robot_args.append(arg)
-            if consumed_next and value is not None:
+            if consumed_next:
                 robot_args.append(value)
 
     # Build the command to run robot.
-    listener = "CLIProgress"
-    if console_colors is not None:
-        listener += f":colors={console_colors}"
-    if console_width is not None:
-        listener += f":width={console_width}"
-    if console_progress is not None:
-        listener += f":console_progress={console_progress}"
-    if verbosity is not None:
-        listener += f":verbosity={verbosity}"
-    cmd = [
-        "robot",
-        "--console=quiet",
-        "--listener",
-        listener,
-        *robot_args,
-    ]
+    listener = "CLIProgress" + "".join(
+        f":{key}={listener_args[key]}" for key in _LISTENER_ARGS if key in listener_args
+    )
+    cmd = [*_ROBOT_PREFIX, listener, *robot_args]
 
     try:
         result = subprocess.run(cmd, stderr=subprocess.PIPE)
@@ -114,5 +121,9 @@ def main():
         if result.returncode > 250:
             sys.stderr.write(result.stderr.decode())
         sys.exit(result.returncode)
+    except FileNotFoundError:
+        # Exit as a shell would when the command can't be found.
+        sys.stderr.write("Could not find robot. Is Robot Framework installed?\n")
+        sys.exit(127)
     except KeyboardInterrupt:
         sys.exit(130)
@@ -1,5 +1,8 @@
+import signal
 import unittest
+from contextlib import redirect_stdout
 from io import StringIO
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from CLIProgress.CLIProgress import (
@@ -26,17 +29,16 @@ class TestVerbosity(unittest.TestCase):
     def test_ordering_less_than_debug(self):
         self.assertLess(Verbosity.NORMAL, Verbosity.DEBUG)
 
-    def test_from_string_lowercase(self):
-        self.assertEqual(Verbosity.from_string("quiet"), Verbosity.QUIET)
-
-    def test_from_string_uppercase(self):
-        self.assertEqual(Verbosity.from_string("NORMAL"), Verbosity.NORMAL)
-
-    def test_from_string_mixed_case(self):
-        self.assertEqual(Verbosity.from_string("DeBuG"), Verbosity.DEBUG)
-
-    def test_from_string_invalid(self):
-        self.assertEqual(Verbosity.from_string("invalid"), Verbosity.NORMAL)
+    def test_from_string(self):
+        cases = [
+            ("quiet", Verbosity.QUIET),
+            ("NORMAL", Verbosity.NORMAL),
+            ("DeBuG", Verbosity.DEBUG),
+            ("invalid", Verbosity.NORMAL),
+        ]
+        for text, expected in cases:
+            with self.subTest(text=text):
+                self.assertEqual(Verbosity.from_string(text), expected)
 
 
 class TestANSI(unittest.TestCase):
@@ -49,6 +51,13 @@ class TestANSI(unittest.TestCase):
         text = "Hello \033[31mWorld\033[0m!"
         self.assertEqual(ANSI.len(text), 12)  # "Hello World!"
 
+    def test_ansi_len_plain(self):
+        self.assertEqual(ANSI.len("Hello World!"), 12)
+
+    def test_cursor_movement(self):
+        self.assertEqual(ANSI.Cursor.UP[3], "\033[3A")
+        self.assertEqual(ANSI.Cursor.DOWN[1], "\033[1B")
+
 
 class TestTraceStack(unittest.TestCase):
     def test_initial_state_trace(self):
@@ -86,6 +95,44 @@ class TestTraceStack(unittest.TestCase):
         stack.flush()
         self.assertIn("Keyword A", stack.trace)
 
+    def test_trace_content_ordering(self):
+        stack = TraceStack()
+        stack.push_keyword("Keyword A")
+        stack.flush(decrement_depth=False)
+        stack.append_log("I", "Line 1", None)
+        stack.flush()
+        stack.append_log("I", "Line 2", None)
+        self.assertEqual(stack.trace, "▶ Keyword A()\n  I Line 1\nI Line 2\n")
+
+    def test_append_log_formatted_on_read(self):
+        stack = TraceStack()
+        stack.push_keyword("Keyword A")
+        stack.flush(decrement_depth=False)
+        stack.append_log("I", "Line 1\nLine 2", None)
+        self.assertIsInstance(stack._trace_parts[-1], tuple)
+        self.assertEqual(stack.trace, "▶ Keyword A()\n  I Line 1\n  Line 2\n")
+
+    def test_format_trace_with_header(self):
+        stack = TraceStack()
+        self.assertEqual(stack.format_trace("Header"), "")
+        stack.append_log("I", "Line 1", None)
+        self.assertEqual(
+            stack.format_trace("Header", "===="), "Header\n====\nI Line 1\n"
+        )
+
+    def test_append_keyword_status_formatted_on_read(self):
+        stack = TraceStack()
+        stack.append_keyword_status("PASSED", 1500)
+        self.assertIsInstance(stack._trace_parts[-1], tuple)
+        self.assertEqual(stack.trace, "  PASSED     2s\n")
+
+    def test_push_keyword_args_formatted_on_read(self):
+        stack = TraceStack()
+        stack.push_keyword("Keyword A", ["x", 1])
+        stack.flush()
+        self.assertIsInstance(stack._trace_parts[-1], tuple)
+        self.assertEqual(stack.trace, "▶ Keyword A('x', 1)\n")
+
 
 class TestTestStatistics(unittest.TestCase):
     def test_start_suite_counts(self):
@@ -125,47 +172,55 @@ class TestTestStatistics(unittest.TestCase):
 
 
 class TestTestTimings(unittest.TestCase):
-    def test_format_time_none(self):
-        self.assertEqual(TestTimings.format_time(None), "unknown")
-
-    def test_format_time_seconds_only(self):
-        self.assertEqual(TestTimings.format_time(45), "45s")
-
-    def test_format_time_minutes_seconds(self):
-        self.assertEqual(TestTimings.format_time(125), " 2m  5s")
-
-    def test_format_time_hours_minutes_seconds(self):
-        self.assertEqual(TestTimings.format_time(3665), " 1h  1m  5s")
-
-    @patch("time.time", return_value=100.0)
+    def test_format_time(self):
+        cases = [
+            (None, "unknown"),
+            (45, "45s"),
+            (59.6, " 1m  0s"),
+            (0.5, " 1s"),
+            (0.4, " 0s"),
+            (62.5, " 1m  3s"),
+            (125, " 2m  5s"),
+            (3665, " 1h  1m  5s"),
+        ]
+        for seconds, expected in cases:
+            with self.subTest(seconds=seconds):
+                self.assertEqual(TestTimings.format_time(seconds), expected)
+
+    @patch("time.monotonic", return_value=100.0)
     def test_elapsed_time(self, mock_time):
         timings = TestTimings()
         timings.start_suite()
         mock_time.return_value = 110.0
         self.assertEqual(timings.get_elapsed_time(), 10.0)
 
+    @patch("time.monotonic", return_value=100.0)
+    def test_start_test_single_clock_read(self, mock_time):
+        timings = TestTimings()
+        timings.start_test()
+        self.assertEqual(mock_time.call_count, 1)
+        self.assertEqual(timings.run_start_time, timings.current_test_start_time)
 
-class TestCLIProgressHelper(unittest.TestCase):
-    def setUp(self):
-        self.cli = CLIProgress(verbosity="NORMAL", console_progress="NONE")
-
-    def test_past_tense_upper_pass(self):
-        self.assertEqual(self.cli._past_tense("PASS"), "PASSED")
-
-    def test_past_tense_upper_fail(self):
-        self.assertEqual(self.cli._past_tense("FAIL"), "FAILED")
-
-    def test_past_tense_upper_skip(self):
-        self.assertEqual(self.cli._past_tense("SKIP"), "SKIPPED")
-
-    def test_past_tense_lower(self):
-        self.assertEqual(self.cli._past_tense("pass"), "passed")
-
-    def test_past_tense_title_try(self):
-        self.assertEqual(self.cli._past_tense("Try"), "Tried")
 
-    def test_past_tense_title_stop(self):
-        self.assertEqual(self.cli._past_tense("Stop"), "Stopped")
+class TestCLIProgressHelper(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The helpers under test don't modify the listener, so share one.
+        cls.cli = CLIProgress(verbosity="NORMAL", console_progress="NONE")
+
+    def test_past_tense(self):
+        cases = [
+            ("PASS", "PASSED"),
+            ("FAIL", "FAILED"),
+            ("SKIP", "SKIPPED"),
+            ("NOT RUN", "NOT RUN"),
+            ("pass", "passed"),
+            ("Try", "Tried"),
+            ("Stop", "Stopped"),
+        ]
+        for verb, expected in cases:
+            with self.subTest(verb=verb):
+                self.assertEqual(self.cli._past_tense(verb), expected)
 
     def test_verbosity_settings_debug(self):
         cli = CLIProgress(verbosity="DEBUG", console_progress="NONE")
@@ -220,7 +275,7 @@ class TestStatisticsFormatReturns(unittest.TestCase):
 
 
 class TestTimingsFormatETA(unittest.TestCase):
-    @patch("time.time", return_value=120.0)
+    @patch("time.monotonic", return_value=120.0)
     def test_format_eta_calculates(self, mock_time):
         timings = TestTimings()
         timings.run_start_time = 100.0  # elapsed = 20s
@@ -264,13 +319,39 @@ class TestCLIProgressInitialization(unittest.TestCase):
         import sys
 
         self.assertEqual(cli.progress_stream, sys.stdout)
+        cli.close()
+
+    @unittest.skipUnless(hasattr(signal, "SIGWINCH"), "requires SIGWINCH")
+    @patch("signal.siginterrupt")
+    @patch("signal.signal", return_value=None)
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_sigwinch_handler_restored(
+        self, mock_stdout, mock_signal, mock_siginterrupt
+    ):
+        cli = CLIProgress(console_progress="STDOUT")
+        mock_signal.assert_called_once_with(signal.SIGWINCH, cli._on_resize)
+        mock_siginterrupt.assert_called_once_with(signal.SIGWINCH, False)
+        cli.close()
+        mock_signal.assert_called_with(signal.SIGWINCH, signal.SIG_DFL)
 
     @patch("sys.stderr", new_callable=StringIO)
-    def test_console_progress_stderr(self, mock_stderr):
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_console_progress_stderr(self, mock_stdout, mock_stderr):
         cli = CLIProgress(console_progress="STDERR")
         import sys
 
         self.assertEqual(cli.progress_stream, sys.stderr)
+        cli.close()
+
+    @patch("sys.stderr", new_callable=StringIO)
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_console_progress_auto_no_tty(self, mock_stdout, mock_stderr):
+        cli = CLIProgress(console_progress="AUTO")
+        self.assertIsNone(cli.progress_stream)
+        cli.start_keyword(MagicMock(), MagicMock())
+        cli._print_trace("Trace")
+        self.assertEqual(mock_stdout.getvalue(), "Trace\n")
+        self.assertEqual(mock_stderr.getvalue(), "")
 
 
 class TestCLIProgressLayoutAndProgressBox(unittest.TestCase):
@@ -281,6 +362,47 @@ class TestCLIProgressLayoutAndProgressBox(unittest.TestCase):
         self.cli = CLIProgress(console_progress="NONE", width=80)
         self.cli.progress_stream = self.stream
 
+    @patch("shutil.get_terminal_size")
+    def test_resize_redraws_progress_box(self, mock_size):
+        import os
+
+        self.cli._write_progress_line(0, "Suite")
+        mock_size.return_value = os.terminal_size((60, 40))
+        self.cli._on_resize(None, None)
+        self.cli._maybe_repaint(force=True)
+        self.assertEqual(self.cli.terminal_width, 60)
+        self.assertEqual(len(self.cli.progress_lines[0]), 56)
+        self.assertIn("┌" + "─" * 58 + "┐", self.stream.getvalue())
+
+    @patch("shutil.get_terminal_size")
+    def test_resize_shrink_relays_out_lines(self, mock_size):
+        import os
+
+        mock_size.return_value = os.terminal_size((80, 40))
+        self.cli._set_terminal_width()
+        self.cli._write_progress_line(1, "[TEST 1/1] " + "A" * 60, "(elapsed 1s)")
+        mock_size.return_value = os.terminal_size((60, 40))
+        self.cli._on_resize(None, None)
+        self.cli._maybe_repaint(force=True)
+        line = self.cli.progress_lines[1]
+        self.assertEqual(len(line), 56)
+        self.assertTrue(line.endswith(" (elapsed 1s)"))
+        self.assertIn("A...", line)
+        # Only the box's own five rows are cleared, whether or not the
+        # terminal reflowed it.
+        self.assertEqual(self.stream.getvalue().count(ANSI.Cursor.CLEAR_LINE), 5)
+
+    @patch("shutil.get_terminal_size")
+    def test_resize_tiny_terminal_clamped(self, mock_size):
+        import os
+
+        mock_size.return_value = os.terminal_size((2, 40))
+        self.cli._on_resize(None, None)
+        self.cli._maybe_repaint(force=True)
+        self.assertEqual(self.cli.terminal_width, 8)
+        self.cli._draw_progress_box()
+        self.assertIn("┌──────┐", self.stream.getvalue())
+
     def test_draw_progress_box(self):
         self.cli._draw_progress_box()
         output = self.stream.getvalue()
@@ -296,31 +418,228 @@ class TestCLIProgressLayoutAndProgressBox(unittest.TestCase):
         expected_left_len = self.cli.terminal_width - 4 - 10 - 1
         self.assertTrue(line.startswith("A" * (expected_left_len - 3) + "..."))
 
+    @patch("time.monotonic", return_value=100.0)
+    def test_format_timings_cached(self, mock_time):
+        first = self.cli._format_timings()
+        self.cli.stats.completed_tests = 1
+        self.cli.stats.top_level_test_count = 2
+        self.assertEqual(self.cli._format_timings(), first)
+
+        mock_time.return_value = 101.0
+        self.assertNotEqual(self.cli._format_timings(), first)
+
+    def test_start_keyword_long_args_truncated(self):
+        kw_res_mock = MagicMock()
+        kw_res_mock.kwname = "My Keyword"
+        kw_res_mock.libname = None
+        kw_res_mock.args = ["A" * 1000]
+
+        self.cli.start_keyword(MagicMock(), kw_res_mock)
+        line = self.cli.progress_lines[2]
+        self.assertEqual(len(line), self.cli.terminal_width - 4)
+        self.assertTrue(line.endswith("..."))
+        self.cli.suite_trace_stack.flush()
+        self.assertIn("A" * 1000, self.cli.suite_trace_stack.trace)
+
+    def test_start_keyword_args_preview(self):
+        kw_res_mock = MagicMock()
+        kw_res_mock.kwname = "My Keyword"
+        kw_res_mock.libname = None
+        kw_res_mock.args = ["x", 1]
+
+        self.cli.start_keyword(MagicMock(), kw_res_mock)
+        self.assertEqual(self.cli.progress_lines[2].rstrip(), "[My Keyword]  'x', 1")
+
     def test_clear_progress_box(self):
         self.cli._clear_progress_box()
         self.assertIn(ANSI.Cursor.CLEAR_LINE, self.stream.getvalue())
 
+    def test_end_test_single_write(self):
+        self.cli.stats.top_level_test_count = 1
+        test_mock = MagicMock()
+        test_mock.name = "My Test"
+        result_mock = MagicMock()
+        result_mock.not_run = True
+        self.cli.start_test(test_mock, result_mock)
+        self.cli._write_progress_line(2, "keyword")
+
+        stream = MagicMock()
+        self.cli.progress_stream = stream
+        self.cli.end_test(test_mock, result_mock)
+        self.assertEqual(stream.write.call_count, 1)
+        self.assertEqual(stream.flush.call_count, 1)
+
+    def test_draw_progress_box_single_write(self):
+        stream = MagicMock()
+        self.cli.progress_stream = stream
+        self.cli._draw_progress_box()
+        self.assertEqual(stream.write.call_count, 1)
+        self.assertEqual(stream.flush.call_count, 1)
+
+    def test_write_progress_line_unchanged(self):
+        self.cli._write_progress_line(0, "text")
+        self.cli._maybe_repaint()
+        self.stream.seek(0)
+        self.stream.truncate()
+        self.cli._write_progress_line(0, "text")
+        self.cli._maybe_repaint()
+        self.assertEqual(self.stream.getvalue(), "")
+
+    def test_write_progress_line_clear_blank(self):
+        self.cli._write_progress_line(2)
+        self.assertEqual(self.cli.progress_lines[2], " " * self.cli._text_width)
+        self.cli._maybe_repaint()
+        self.assertEqual(self.stream.getvalue(), "")
+
+    @patch("threading.Thread")
+    @patch("time.monotonic", return_value=100.0)
+    def test_maybe_repaint_rate_limited(self, mock_time, mock_thread):
+        self.cli._write_progress_line(2, "first")
+        self.cli._maybe_repaint()
+        self.cli._write_progress_line(2, "second")
+        self.cli._maybe_repaint()
+        output = self.stream.getvalue()
+        self.assertIn("first", output)
+        self.assertNotIn("second", output)
+        self.assertTrue(self.cli.progress_lines[2].startswith("second"))
+
+        mock_time.return_value = 101.0
+        self.cli._maybe_repaint()
+        self.assertIn("second", self.stream.getvalue())
+
+    @patch("threading.Thread")
+    @patch("time.monotonic", return_value=100.0)
+    def test_maybe_repaint_skips_reverted_line(self, mock_time, mock_thread):
+        self.cli._write_progress_line(2, "first")
+        self.cli._maybe_repaint()
+        self.cli._write_progress_line(2, "second")
+        self.cli._maybe_repaint()
+        self.cli._write_progress_line(2, "first")
+        self.stream.seek(0)
+        self.stream.truncate()
+        mock_time.return_value = 101.0
+        self.cli._maybe_repaint()
+        self.assertEqual(self.stream.getvalue(), "")
+
+    @patch("threading.Thread")
+    @patch("time.monotonic", return_value=100.0)
+    def test_start_keyword_throttled_args_not_formatted(self, mock_time, mock_thread):
+        self.cli._write_progress_line(2, "first")
+        self.cli._maybe_repaint()
+        arg = MagicMock()
+        arg.__repr__ = MagicMock(return_value="arg")
+        kw_res_mock = MagicMock()
+        kw_res_mock.kwname = "My Keyword"
+        kw_res_mock.libname = None
+        kw_res_mock.args = [arg]
+
+        self.cli.start_keyword(MagicMock(), kw_res_mock)
+        arg.__repr__.assert_not_called()
+        mock_time.return_value = 101.0
+        self.cli._maybe_repaint()
+        arg.__repr__.assert_called_once()
+
+    @patch("threading.Thread")
+    @patch("time.monotonic", return_value=100.0)
+    def test_maybe_repaint_schedules_trailing_repaint(self, mock_time, mock_thread):
+        self.cli._write_progress_line(2, "first")
+        self.cli._maybe_repaint()
+        self.cli._write_progress_line(2, "second")
+        self.cli._maybe_repaint()
+        self.cli._write_progress_line(2, "third")
+        self.cli._maybe_repaint()
+        mock_thread.assert_called_once_with(
+            target=self.cli._run_repaint_thread,
+            name="CLIProgress repaint",
+            daemon=True,
+        )
+        mock_thread.return_value.start.assert_called_once()
+        self.assertTrue(self.cli._repaint_event.is_set())
+
+        self.cli._trailing_repaint()
+        self.assertIn("third", self.stream.getvalue())
+
+    @patch("threading.Thread")
+    @patch("time.monotonic", return_value=100.0)
+    def test_start_test_painted_after_forced_repaint(self, mock_time, mock_thread):
+        self.cli.stats.top_level_test_count = 1
+        self.cli._write_progress_line(0, "Suite")
+        self.cli._maybe_repaint(force=True)
+        self.cli.start_test(SimpleNamespace(name="My Test"), None)
+        self.assertNotIn("My Test", self.stream.getvalue())
+        mock_thread.return_value.start.assert_called_once()
+
+        self.cli._trailing_repaint()
+        self.assertIn("My Test", self.stream.getvalue())
+        self.assertEqual(self.cli._painted_lines, self.cli.progress_lines)
+
+    @patch("threading.Thread")
+    @patch("time.monotonic", return_value=100.0)
+    def test_start_keyword_painted_while_running(self, mock_time, mock_thread):
+        self.cli._write_progress_line(2, "first")
+        self.cli._maybe_repaint(force=True)
+        kw_res_mock = SimpleNamespace(kwname="Sleep", libname=None, args=["5s"])
+        self.cli.start_keyword(MagicMock(), kw_res_mock)
+        self.assertNotIn("Sleep", self.stream.getvalue())
+        mock_thread.return_value.start.assert_called_once()
+
+        self.cli._trailing_repaint()
+        self.assertIn("[Sleep]  '5s'", self.stream.getvalue())
+        self.assertIsNone(self.cli._pending_keyword)
+
+    @patch("threading.Thread")
+    @patch("time.monotonic", return_value=100.0)
+    def test_close_cancels_trailing_repaint(self, mock_time, mock_thread):
+        self.cli._write_progress_line(2, "first")
+        self.cli._maybe_repaint(force=True)
+        kw_res_mock = SimpleNamespace(kwname="Sleep", libname=None, args=["5s"])
+        self.cli.start_keyword(MagicMock(), kw_res_mock)
+
+        with redirect_stdout(StringIO()):
+            self.cli.close()
+        self.assertIsNone(self.cli._repaint_thread)
+        self.cli._trailing_repaint()
+        self.assertNotIn("Sleep", self.stream.getvalue())
+        # The woken repaint thread sees it was stopped and returns.
+        self.cli._run_repaint_thread()
+
+    @patch("threading.Thread")
+    @patch("time.monotonic", return_value=100.0)
+    def test_trailing_repaint_write_error_stops_painting(self, mock_time, mock_thread):
+        self.cli._write_progress_line(2, "first")
+        self.cli._maybe_repaint()
+        self.cli._write_progress_line(2, "second")
+        self.cli._maybe_repaint()
+        stream = MagicMock()
+        stream.write.side_effect = BrokenPipeError
+        self.cli.progress_stream = stream
+
+        self.cli._trailing_repaint()
+        self.assertIsNone(self.cli.progress_stream)
+        self.assertEqual(self.cli._buf, [])
+
+    @patch("time.monotonic", return_value=100.0)
+    def test_maybe_repaint_forced(self, mock_time):
+        self.cli._write_progress_line(2, "first")
+        self.cli._maybe_repaint()
+        self.cli._write_progress_line(2, "second")
+        self.cli._maybe_repaint(force=True)
+        self.assertIn("second", self.stream.getvalue())
+
 
 class TestCLIProgressLifecycle(unittest.TestCase):
     def setUp(self):
-        from io import StringIO
-
-        patcher = patch("sys.stdout", new_callable=StringIO)
-        self.mock_stdout = patcher.start()
+        self.mock_stdout = StringIO()
+        redirect = redirect_stdout(self.mock_stdout)
+        redirect.__enter__()
+        self.addCleanup(redirect.__exit__, None, None, None)
 
         self.cli = CLIProgress(console_progress="NONE", verbosity="DEBUG")
 
-    def tearDown(self):
-        patch.stopall()
-
     def test_suite_lifecycle(self):
-        suite_mock = MagicMock()
-        suite_mock.suites = [1]
-        suite_mock.test_count = 1
-        suite_mock.full_name = "My_Suite"
+        suite_mock = SimpleNamespace(suites=[1], test_count=1, full_name="My_Suite")
 
-        result_mock = MagicMock()
-        result_mock.status = "PASS"
+        result_mock = SimpleNamespace(status="PASS")
 
         self.cli.start_suite(suite_mock, result_mock)
         self.assertEqual(self.cli.stats.started_suites, 1)
@@ -329,46 +648,44 @@ class TestCLIProgressLifecycle(unittest.TestCase):
         self.assertEqual(self.cli.suite_trace_stack._depth, 0)
 
     def test_test_lifecycle(self):
-        suite_mock = MagicMock()
-        suite_mock.suites = [1]
-        suite_mock.test_count = 1
-        suite_mock.full_name = "My_Suite"
+        suite_mock = SimpleNamespace(suites=[1], test_count=1, full_name="My_Suite")
 
         self.cli.start_suite(suite_mock, MagicMock())
 
-        test_mock = MagicMock()
-        test_mock.name = "My Test"
-        test_mock.full_name = "My_Suite.My Test"
+        test_mock = SimpleNamespace(name="My Test", full_name="My_Suite.My Test")
 
-        result_mock = MagicMock()
-        result_mock.status = "PASS"
-        result_mock.not_run = False
-        result_mock.message = "All good"
+        result_mock = SimpleNamespace(status="PASS", not_run=False, message="All good")
 
         self.cli.start_test(test_mock, result_mock)
         self.assertTrue(self.cli.in_test)
+        self.assertIs(self.cli._active_stack, self.cli.test_trace_stack)
 
         self.cli.end_test(test_mock, result_mock)
         self.assertFalse(self.cli.in_test)
+        self.assertIs(self.cli._active_stack, self.cli.suite_trace_stack)
         self.assertEqual(self.cli.stats.passed_tests, 1)
 
+    def test_print_trace_shared_stream_single_write(self):
+        self.cli.progress_stream = self.mock_stdout
+        with (
+            patch.object(self.mock_stdout, "write") as mock_write,
+            patch.object(self.mock_stdout, "flush") as mock_flush,
+        ):
+            self.cli._print_trace("Some trace")
+            self.assertEqual(mock_write.call_count, 1)
+            self.assertEqual(mock_flush.call_count, 1)
+        output = mock_write.call_args[0][0]
+        self.assertTrue(output.startswith(CLIProgress._CLEAR_SEQ + "Some trace\n┌"))
+
     def test_test_lifecycle_fail_with_errors(self):
-        suite_mock = MagicMock()
-        suite_mock.suites = [1]
-        suite_mock.test_count = 1
+        suite_mock = SimpleNamespace(suites=[1], test_count=1, full_name="My_Suite")
         self.cli.start_suite(suite_mock, MagicMock())
-        test_mock = MagicMock()
-        test_mock.name = "My Test"
-        result_mock = MagicMock()
-        result_mock.status = "FAIL"
-        result_mock.not_run = False
-        result_mock.message = "Failure"
+        test_mock = SimpleNamespace(name="My Test", full_name="My_Suite.My Test")
+        result_mock = SimpleNamespace(status="FAIL", not_run=False, message="Failure")
 
         self.cli.start_test(test_mock, result_mock)
 
-        msg = MagicMock()
-        msg.level = "ERROR"
-        msg.message = "An error occurred"
+        msg = SimpleNamespace(level="ERROR", message="An error occurred")
         self.cli.log_message(msg)
 
         self.cli.end_test(test_mock, result_mock)
@@ -379,27 +696,23 @@ class TestCLIProgressKeywords(unittest.TestCase):
     def setUp(self):
         self.cli = CLIProgress(console_progress="NONE", verbosity="DEBUG")
 
-        suite_mock = MagicMock()
-        suite_mock.suites = [1]
-        suite_mock.test_count = 1
+        suite_mock = SimpleNamespace(suites=[1], test_count=1, full_name="My_Suite")
         self.cli.start_suite(suite_mock, MagicMock())
 
-        self.test_mock = MagicMock()
-        self.test_mock.name = "My Test"
-        self.result_mock = MagicMock()
-        self.result_mock.status = "PASS"
-        self.result_mock.not_run = False
+        self.test_mock = SimpleNamespace(name="My Test", full_name="My_Suite.My Test")
+        self.result_mock = SimpleNamespace(status="PASS", not_run=False)
 
         self.cli.start_test(self.test_mock, self.result_mock)
 
     def test_keyword_lifecycle(self):
         kw_mock = MagicMock()
-        kw_res_mock = MagicMock()
-        kw_res_mock.name = "My Keyword"
-        kw_res_mock.libname = "BuiltIn"
-        kw_res_mock.args = ["arg1"]
-        kw_res_mock.status = "PASS"
-        kw_res_mock.elapsedtime = 1500
+        kw_res_mock = SimpleNamespace(
+            name="My Keyword",
+            libname="BuiltIn",
+            args=["arg1"],
+            status="PASS",
+            elapsedtime=1500,
+        )
 
         self.cli.start_keyword(kw_mock, kw_res_mock)
         self.assertEqual(self.cli.test_trace_stack._depth, 1)
@@ -408,10 +721,17 @@ class TestCLIProgressKeywords(unittest.TestCase):
         self.assertEqual(self.cli.test_trace_stack._depth, 0)
         self.assertIn("2s", self.cli.test_trace_stack.trace)
 
+    def test_keyword_missing_attributes(self):
+        kw_mock = MagicMock()
+        kw_res_mock = SimpleNamespace(name="FOR", status="PASS")
+
+        self.cli.start_keyword(kw_mock, kw_res_mock)
+        self.cli.end_keyword(kw_mock, kw_res_mock)
+        self.assertIn("▶ FOR()", self.cli.test_trace_stack.trace)
+
     def test_keyword_lifecycle_not_run(self):
         kw_mock = MagicMock()
-        kw_res_mock = MagicMock()
-        kw_res_mock.status = "NOT RUN"
+        kw_res_mock = SimpleNamespace(status="NOT RUN")
 
         self.cli.start_keyword(kw_mock, kw_res_mock)
         self.cli.end_keyword(kw_mock, kw_res_mock)
@@ -421,18 +741,13 @@ class TestCLIProgressKeywords(unittest.TestCase):
 class TestCLIProgressLogging(unittest.TestCase):
     def setUp(self):
         self.cli = CLIProgress(console_progress="NONE", verbosity="DEBUG", colors="OFF")
-        suite_mock = MagicMock()
-        suite_mock.suites = [1]
-        suite_mock.test_count = 1
+        suite_mock = SimpleNamespace(suites=[1], test_count=1, full_name="My_Suite")
         self.cli.start_suite(suite_mock, MagicMock())
-        test_mock = MagicMock()
-        test_mock.name = "My Test"
+        test_mock = SimpleNamespace(name="My Test", full_name="My_Suite.My Test")
         self.cli.start_test(test_mock, MagicMock())
 
     def test_log_message_warn(self):
-        msg = MagicMock()
-        msg.level = "WARN"
-        msg.message = "A warning\nLine 2"
+        msg = SimpleNamespace(level="WARN", message="A warning\nLine 2")
         self.cli.log_message(msg)
 
         self.assertEqual(self.cli.stats.warnings, 1)
@@ -441,9 +756,7 @@ class TestCLIProgressLogging(unittest.TestCase):
         self.assertIn("Line 2", self.cli.test_trace_stack.trace)
 
     def test_log_message_error(self):
-        msg = MagicMock()
-        msg.level = "ERROR"
-        msg.message = "An error"
+        msg = SimpleNamespace(level="ERROR", message="An error")
         self.cli.log_message(msg)
 
         self.assertEqual(self.cli.stats.errors, 1)
@@ -451,23 +764,62 @@ class TestCLIProgressLogging(unittest.TestCase):
         self.assertIn("E An error", self.cli.test_trace_stack.trace)
 
     def test_log_message_info(self):
-        msg = MagicMock()
-        msg.level = "INFO"
-        msg.message = "Info msg"
+        msg = SimpleNamespace(level="INFO", message="Info msg")
         self.cli.log_message(msg)
 
         self.assertIn("I Info msg", self.cli.test_trace_stack.trace)
 
+    def test_log_message_empty(self):
+        msg = SimpleNamespace(level="INFO", message="")
+        self.cli.log_message(msg)
+
+        self.assertIn("I \n", self.cli.test_trace_stack.trace)
+
+    def test_log_message_colored(self):
+        self.cli = CLIProgress(console_progress="NONE", verbosity="DEBUG", colors="ON")
+        self.cli.start_test(MagicMock(), MagicMock())
+        msg = SimpleNamespace(level="WARN", message="A warning\nLine 2")
+        self.cli.log_message(msg)
+
+        trace = self.cli.test_trace_stack.trace
+        self.assertEqual(
+            trace,
+            ANSI.Fore.BRIGHT_YELLOW("W A warning")
+            + "\n"
+            + ANSI.Fore.BRIGHT_YELLOW("  Line 2")
+            + "\n",
+        )
+
+    def test_end_keyword_status(self):
+        self.cli = CLIProgress(console_progress="NONE", colors="OFF")
+        kw_result = SimpleNamespace(
+            kwname="My Keyword", libname=None, args=[], status="FAIL"
+        )
+        self.cli.start_keyword(MagicMock(), kw_result)
+        self.cli.end_keyword(MagicMock(), kw_result)
+        self.assertEqual(
+            self.cli.suite_trace_stack.trace, "▶ My Keyword()\n  ✗ FAIL    ?s\n"
+        )
+
+    def test_end_keyword_status_colored(self):
+        self.cli = CLIProgress(console_progress="NONE", colors="ON")
+        kw_result = SimpleNamespace(
+            kwname="My Keyword", libname=None, args=[], status="PASS"
+        )
+        self.cli.start_keyword(MagicMock(), kw_result)
+        self.cli.end_keyword(MagicMock(), kw_result)
+        self.assertIn(
+            ANSI.Fore.BRIGHT_GREEN("✓ PASS"), self.cli.suite_trace_stack.trace
+        )
+
 
 class TestCLIProgressClose(unittest.TestCase):
     def test_close_prints_summary(self):
-        from io import StringIO
-
         cli = CLIProgress(console_progress="NONE", verbosity="NORMAL")
         cli.stats.top_level_test_count = 1
         cli.stats.completed_tests = 1
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+        with redirect_stdout(StringIO()) as mock_stdout:
             cli.close()
             output = mock_stdout.getvalue()
             self.assertIn("RUN COMPLETE", output)
@@ -0,0 +1,81 @@
+import unittest
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from CLIProgress import runner
+
+
+class TestRunner(unittest.TestCase):
+    def run_main(self, *args):
+        """Run the runner with the given arguments, returning the robot command."""
+        with (
+            patch("sys.argv", ["robot-cli", *args]),
+            patch("subprocess.run", return_value=MagicMock(returncode=0)) as run,
+        ):
+            with self.assertRaises(SystemExit) as cm:
+                runner.main()
+        self.assertEqual(cm.exception.code, 0)
+        return run.call_args[0][0]
+
+    def test_default_command(self):
+        self.assertEqual(
+            self.run_main("tests"),
+            ["robot", "--console=quiet", "--listener", "CLIProgress", "tests"],
+        )
+
+    def test_other_options_passed_through(self):
+        cmd = self.run_main("--include", "tag", "-itag", "--loglevel=DEBUG", "tests")
+        self.assertEqual(
+            cmd[4:], ["--include", "tag", "-itag", "--loglevel=DEBUG", "tests"]
+        )
+
+    def test_console_colors(self):
+        cmd = self.run_main("-C", "off", "tests")
+        self.assertEqual(cmd[3], "CLIProgress:colors=off")
+        self.assertEqual(cmd[4:], ["-C", "off", "tests"])
+
+    def test_console_colors_normalized(self):
+        cmd = self.run_main("--Console-Colors=on", "tests")
+        self.assertEqual(cmd[3], "CLIProgress:colors=on")
+        self.assertEqual(cmd[4:], ["--Console-Colors=on", "tests"])
+
+    def test_console_width_inline_short(self):
+        cmd = self.run_main("-W100", "tests")
+        self.assertEqual(cmd[3], "CLIProgress:width=100")
+        self.assertEqual(cmd[4:], ["-W100", "tests"])
+
+    def test_short_options_case_sensitive(self):
+        cmd = self.run_main("-c", "off", "-w", "80", "tests")
+        self.assertEqual(cmd[3], "CLIProgress")
+        self.assertEqual(cmd[4:], ["-c", "off", "-w", "80", "tests"])
+
+    def test_console_progress_consumed(self):
+        cmd = self.run_main("--consoleprogress", "stderr", "tests")
+        self.assertEqual(cmd[3], "CLIProgress:console_progress=stderr")
+        self.assertEqual(cmd[4:], ["tests"])
+
+    def test_verbosity_flags_consumed(self):
+        cmd = self.run_main("--verbose", "tests")
+        self.assertEqual(cmd[3], "CLIProgress:verbosity=DEBUG")
+        cmd = self.run_main("--verbose", "--quiet", "tests")
+        self.assertEqual(cmd[3], "CLIProgress:verbosity=QUIET")
+        self.assertEqual(cmd[4:], ["tests"])
+
+    def test_listener_argument_order(self):
+        cmd = self.run_main("--quiet", "-W", "80", "-C", "on", "tests")
+        self.assertEqual(cmd[3], "CLIProgress:colors=on:width=80:verbosity=QUIET")
+
+    def test_last_value_wins(self):
+        cmd = self.run_main("-C", "on", "--consolecolors", "off", "tests")
+        self.assertEqual(cmd[3], "CLIProgress:colors=off")
+
+    def test_robot_not_found(self):
+        with (
+            patch("sys.argv", ["robot-cli", "tests"]),
+            patch("subprocess.run", side_effect=FileNotFoundError),
+            patch("sys.stderr", new_callable=StringIO) as stderr,
+        ):
+            with self.assertRaises(SystemExit) as cm:
+                runner.main()
+        self.assertEqual(cm.exception.code, 127)
+        self.assertIn("Could not find robot", stderr.getvalue())